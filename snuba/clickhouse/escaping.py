@@ -1,5 +1,5 @@
 import re
-
+from functools import lru_cache
 from typing import Optional, Pattern
 
 ESCAPE_STRING_RE = re.compile(r"(['\\])")
@@ -34,9 +34,15 @@ def escape_expression(expr: Optional[str], regex: Pattern[str]) -> Optional[str]
         return "{}`{}`".format(*negate_match.groups())
 
 
+# Identifiers and aliases come from a small set (column and function names,
+# aliases set during parsing) and are escaped on every node visited by the
+# formatter, so the result is memoized. String literals are not, since they
+# are mostly unique user input.
+@lru_cache(maxsize=4096)
 def escape_alias(alias: Optional[str]) -> Optional[str]:
     return escape_expression(alias, SAFE_ALIAS_RE)
 
 
+@lru_cache(maxsize=4096)
 def escape_identifier(col: Optional[str]) -> Optional[str]:
     return escape_expression(col, SAFE_COL_RE)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import Optional, Sequence, cast
+from typing import Callable, Mapping, Optional, Sequence, cast
 
 from snuba.clickhouse.escaping import escape_alias, escape_identifier, escape_string
 from snuba.query.conditions import (
@@ -35,14 +35,26 @@ class ClickhouseExpressionFormatterBase(ExpressionVisitor[str], ABC):
     """
 
     def __init__(self, parsing_context: Optional[ParsingContext] = None) -> None:
-        self.__parsing_context = (
-            parsing_context if parsing_context is not None else ParsingContext()
-        )
+        context = parsing_context if parsing_context is not None else ParsingContext()
+        # _alias runs for almost every node, so bind the context methods once
+        # instead of resolving them through the context on each call.
+        self.__is_alias_present = context.is_alias_present
+        self.__add_alias = context.add_alias
+        # Functions that are not formatted as a plain function call. Most
+        # nodes are not in here, so a single lookup replaces comparing the
+        # function name against each of them.
+        self.__special_functions: Mapping[str, Callable[[FunctionCall], str]] = {
+            "array": self.__format_array,
+            BooleanFunctions.AND: self.__format_and,
+            BooleanFunctions.OR: self.__format_or,
+        }
 
     def _alias(self, formatted_exp: str, alias: Optional[str]) -> str:
+        # Most nodes have no alias, so the callers in this module check
+        # for None before calling this to skip the call entirely.
         if not alias:
             return formatted_exp
-        elif self.__parsing_context.is_alias_present(alias):
+        elif self.__is_alias_present(alias):
             ret = escape_alias(alias)
             # This is for the type checker. escape_alias can return None if
             # we pass None. But here we do not pass None so a None return value
@@ -50,7 +62,7 @@ class ClickhouseExpressionFormatterBase(ExpressionVisitor[str], ABC):
             assert ret is not None
             return ret
         else:
-            self.__parsing_context.add_alias(alias)
+            self.__add_alias(alias)
             return f"({formatted_exp} AS {escape_alias(alias)})"
 
     @abstractmethod
@@ -75,7 +87,7 @@ class ClickhouseExpressionFormatterBase(ExpressionVisitor[str], ABC):
 
     def visit_literal(self, exp: Literal) -> str:
         if exp.value is None:
-            return self._alias("NULL", exp.alias)
+            return "NULL" if exp.alias is None else self._alias("NULL", exp.alias)
         if isinstance(exp.value, bool):
             return self._format_boolean_literal(exp)
         elif isinstance(exp.value, str):
@@ -90,29 +102,26 @@ class ClickhouseExpressionFormatterBase(ExpressionVisitor[str], ABC):
             raise ValueError(f"Unexpected literal type {type(exp.value)}")
 
     def visit_column(self, exp: Column) -> str:
-        ret = []
-        ret_unescaped = []
         if exp.table_name:
-            ret.append(escape_identifier(exp.table_name) or "")
-            ret_unescaped.append(exp.table_name or "")
-            ret.append(".")
-            ret_unescaped.append(".")
             # If there is a table name and the column name contains a ".",
             # then we need to escape the column name using alias regex rules
             # to clearly demarcate the table and columns
-            ret.append(escape_alias(exp.column_name) or "")
+            table_name = escape_identifier(exp.table_name) or ""
+            column_name = escape_alias(exp.column_name) or ""
+            formatted = f"{table_name}.{column_name}"
+            unescaped = f"{exp.table_name}.{exp.column_name}"
         else:
-            ret.append(escape_identifier(exp.column_name) or "")
-        ret_unescaped.append(exp.column_name)
+            formatted = escape_identifier(exp.column_name) or ""
+            unescaped = exp.column_name
         # De-clutter the output query by not applying an alias to a
         # column if the column name is the same as the alias to make
         # the query more readable.
         # This happens often since we apply column aliases during
         # parsing so the names are preserved during query processing.
-        if exp.alias != "".join(ret_unescaped):
-            return self._alias("".join(ret), exp.alias)
+        if exp.alias is None or exp.alias == unescaped:
+            return formatted
         else:
-            return "".join(ret)
+            return self._alias(formatted, exp.alias)
 
     def __visit_params(self, parameters: Sequence[Expression]) -> str:
         ret = [p.accept(self) for p in parameters]
@@ -127,28 +136,33 @@ class ClickhouseExpressionFormatterBase(ExpressionVisitor[str], ABC):
         # until we actually resolve tags during query translation.
         return f"{self.visit_column(exp.column)}[{self.visit_literal(exp.key)}]"
 
-    def visit_function_call(self, exp: FunctionCall) -> str:
-        if exp.function_name == "array":
-            # Workaround for https://github.com/ClickHouse/ClickHouse/issues/11622
-            # Some distributed queries fail when arrays are passed as array(1,2,3)
-            # and work when they are passed as [1, 2, 3]
-            return self._alias(f"[{self.__visit_params(exp.parameters)}]", exp.alias)
+    def __format_array(self, exp: FunctionCall) -> str:
+        # Workaround for https://github.com/ClickHouse/ClickHouse/issues/11622
+        # Some distributed queries fail when arrays are passed as array(1,2,3)
+        # and work when they are passed as [1, 2, 3]
+        ret = f"[{self.__visit_params(exp.parameters)}]"
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
+
+    def __format_and(self, exp: FunctionCall) -> str:
+        formatted = [c.accept(self) for c in get_first_level_and_conditions(exp)]
+        return " AND ".join(formatted)
 
-        elif exp.function_name == BooleanFunctions.AND:
-            formatted = (c.accept(self) for c in get_first_level_and_conditions(exp))
-            return " AND ".join(formatted)
+    def __format_or(self, exp: FunctionCall) -> str:
+        formatted = [c.accept(self) for c in get_first_level_or_conditions(exp)]
+        return f"({' OR '.join(formatted)})"
 
-        elif exp.function_name == BooleanFunctions.OR:
-            formatted = (c.accept(self) for c in get_first_level_or_conditions(exp))
-            return f"({' OR '.join(formatted)})"
+    def visit_function_call(self, exp: FunctionCall) -> str:
+        special_formatter = self.__special_functions.get(exp.function_name)
+        if special_formatter is not None:
+            return special_formatter(exp)
 
         ret = f"{escape_identifier(exp.function_name)}({self.__visit_params(exp.parameters)})"
-        return self._alias(ret, exp.alias)
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
     def visit_curried_function_call(self, exp: CurriedFunctionCall) -> str:
         int_func = exp.internal_function.accept(self)
         ret = f"{int_func}({self.__visit_params(exp.parameters)})"
-        return self._alias(ret, exp.alias)
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
     def __escape_identifier_enforce(self, expr: str) -> str:
         ret = escape_identifier(expr)
@@ -163,7 +177,7 @@ class ClickhouseExpressionFormatterBase(ExpressionVisitor[str], ABC):
     def visit_lambda(self, exp: Lambda) -> str:
         parameters = [self.__escape_identifier_enforce(v) for v in exp.parameters]
         ret = f"({', '.join(parameters)} -> {exp.transformation.accept(self)})"
-        return self._alias(ret, exp.alias)
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
 
 class ClickhouseExpressionFormatter(ClickhouseExpressionFormatterBase):
@@ -175,28 +189,25 @@ class ClickhouseExpressionFormatter(ClickhouseExpressionFormatterBase):
     """
 
     def _format_string_literal(self, exp: Literal) -> str:
-        return self._alias(escape_string(cast(str, exp.value)), exp.alias)
+        ret = escape_string(cast(str, exp.value))
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
     def _format_number_literal(self, exp: Literal) -> str:
-        return self._alias(str(exp.value), exp.alias)
+        ret = str(exp.value)
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
     def _format_boolean_literal(self, exp: Literal) -> str:
-        if exp.value is True:
-            return self._alias("true", exp.alias)
-
-        return self._alias("false", exp.alias)
+        ret = "true" if exp.value is True else "false"
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
     def _format_datetime_literal(self, exp: Literal) -> str:
         value = cast(datetime, exp.value).replace(tzinfo=None, microsecond=0)
-        return self._alias(
-            "toDateTime('{}', 'Universal')".format(value.isoformat()), exp.alias
-        )
+        ret = f"toDateTime('{value.isoformat()}', 'Universal')"
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
     def _format_date_literal(self, exp: Literal) -> str:
-        return self._alias(
-            "toDate('{}', 'Universal')".format(cast(date, exp.value).isoformat()),
-            exp.alias,
-        )
+        ret = f"toDate('{cast(date, exp.value).isoformat()}', 'Universal')"
+        return ret if exp.alias is None else self._alias(ret, exp.alias)
 
 
 class ClickHouseExpressionFormatterAnonymized(ClickhouseExpressionFormatterBase):
@@ -1,5 +1,6 @@
 from abc import ABC
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Optional, Sequence, Union
 
 
@@ -87,12 +88,19 @@ class FormattedQuery(SequenceNode):
     """
 
     def get_sql(self, format: Optional[str] = None) -> str:
-        query = str(self)
+        query = self.__sql
         if format is not None:
             query = f"{query} FORMAT {format}"
 
         return query
 
+    @cached_property
+    def __sql(self) -> str:
+        # The SQL is requested several times while running a query (tracing,
+        # cache key, execution, logging). The formatted tree does not change
+        # so it is serialized only once.
+        return str(self)
+
 
 @dataclass(frozen=True)
 class FormattedSubQuery(SequenceNode):
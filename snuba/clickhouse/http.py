@@ -33,17 +33,18 @@ CLICKHOUSE_ERROR_RE = re.compile(
 JSONRow = bytes  # a single row in JSONEachRow format
 
 
-class JSONRowEncoder(Encoder[bytes, WriterTableRow]):
-    def __default(self, value: Any) -> Any:
-        if isinstance(value, datetime):
-            return value.strftime(DATETIME_FORMAT)
-        else:
-            raise TypeError
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    else:
+        raise TypeError
+
 
+class JSONRowEncoder(Encoder[bytes, WriterTableRow]):
     def encode(self, value: WriterTableRow) -> JSONRow:
-        return cast(
-            bytes, rapidjson.dumps(value, default=self.__default).encode("utf-8")
-        )
+        # A module level default avoids binding a new method object for
+        # every row we encode.
+        return cast(bytes, rapidjson.dumps(value, default=_default).encode("utf-8"))
 
 
 class InsertStatement:
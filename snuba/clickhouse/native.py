@@ -29,7 +29,7 @@ class ClickhousePool(object):
         database: str,
         connect_timeout: int = 1,
         send_receive_timeout: Optional[int] = 300,
-        max_pool_size: int = settings.CLICKHOUSE_MAX_POOL_SIZE,
+        max_pool_size: Optional[int] = None,
         client_settings: Mapping[str, Any] = {},
     ) -> None:
         self.host = host
@@ -41,6 +41,11 @@ class ClickhousePool(object):
         self.send_receive_timeout = send_receive_timeout
         self.client_settings = client_settings
 
+        # Resolve the default here rather than in the signature so that
+        # settings overrides loaded after import are honored.
+        if max_pool_size is None:
+            max_pool_size = settings.CLICKHOUSE_MAX_POOL_SIZE
+
         self.pool: queue.LifoQueue[Optional[Client]] = queue.LifoQueue(max_pool_size)
 
         # Fill the queue up so that doing get() on it will block properly
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from threading import Lock
 from typing import (
     Any,
     Generic,
@@ -157,6 +158,8 @@ class ClickhouseCluster(Cluster[ClickhouseWriterOptions]):
         # The cluster name and distributed cluster name only apply if single_node is set to False
         cluster_name: Optional[str] = None,
         distributed_cluster_name: Optional[str] = None,
+        # Size of each connection pool. Defaults to CLICKHOUSE_MAX_POOL_SIZE.
+        max_connections: Optional[int] = None,
     ):
         super().__init__(storage_sets)
         self.__query_node = ClickhouseNode(host, port)
@@ -167,10 +170,15 @@ class ClickhouseCluster(Cluster[ClickhouseWriterOptions]):
         self.__single_node = single_node
         self.__cluster_name = cluster_name
         self.__distributed_cluster_name = distributed_cluster_name
+        self.__max_connections = max_connections
         self.__reader: Optional[Reader] = None
         self.__connection_cache: MutableMapping[
             Tuple[ClickhouseNode, ClickhouseClientSettings], ClickhousePool
         ] = {}
+        # The API runs with multiple threads per process. Without a lock two
+        # threads could both miss the cache and each build a pool, leaking
+        # the connections held by the one that gets overwritten.
+        self.__connection_cache_lock = Lock()
 
     def __str__(self) -> str:
         return str(self.__query_node)
@@ -200,18 +208,24 @@ class ClickhouseCluster(Cluster[ClickhouseWriterOptions]):
 
         settings, timeout = client_settings.value
         cache_key = (node, client_settings)
-        if cache_key not in self.__connection_cache:
-            self.__connection_cache[cache_key] = ClickhousePool(
-                node.host_name,
-                node.port,
-                self.__user,
-                self.__password,
-                self.__database,
-                client_settings=settings,
-                send_receive_timeout=timeout,
-            )
-
-        return self.__connection_cache[cache_key]
+        connection = self.__connection_cache.get(cache_key)
+        if connection is not None:
+            return connection
+
+        with self.__connection_cache_lock:
+            if cache_key not in self.__connection_cache:
+                self.__connection_cache[cache_key] = ClickhousePool(
+                    node.host_name,
+                    node.port,
+                    self.__user,
+                    self.__password,
+                    self.__database,
+                    client_settings=settings,
+                    send_receive_timeout=timeout,
+                    max_pool_size=self.__max_connections,
+                )
+
+            return self.__connection_cache[cache_key]
 
     def get_reader(self) -> Reader:
         if not self.__reader:
@@ -296,6 +310,7 @@ CLUSTERS = [
         distributed_cluster_name=cluster["distributed_cluster_name"]
         if "distributed_cluster_name" in cluster
         else None,
+        max_connections=cluster.get("max_connections"),
     )
     for cluster in settings.CLUSTERS
 ]
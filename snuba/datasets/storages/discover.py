@@ -18,6 +18,7 @@ from snuba.datasets.storages.events_bool_contexts import EventsBooleanContextsPr
 from snuba.query.processors.arrayjoin_keyvalue_optimizer import (
     ArrayJoinKeyValueOptimizer,
 )
+from snuba.query.processors.condition_simplifier import ConditionSimplifierProcessor
 from snuba.query.processors.empty_tag_condition_processor import (
     EmptyTagConditionProcessor,
 )
@@ -90,6 +91,7 @@ storage = ReadableTableStorage(
         ArrayJoinKeyValueOptimizer("tags"),
         UUIDColumnProcessor(set(["event_id", "trace_id"])),
         EventsBooleanContextsProcessor(),
+        ConditionSimplifierProcessor(),
         PrewhereProcessor(
             [
                 "event_id",
@@ -21,6 +21,7 @@ from snuba.query.expressions import Column, Literal
 from snuba.query.processors.arrayjoin_keyvalue_optimizer import (
     ArrayJoinKeyValueOptimizer,
 )
+from snuba.query.processors.condition_simplifier import ConditionSimplifierProcessor
 from snuba.query.processors.empty_tag_condition_processor import (
     EmptyTagConditionProcessor,
 )
@@ -169,6 +170,7 @@ query_processors = [
     MappingOptimizer("tags", "_tags_hash_map", "events_tags_hash_map_enabled"),
     EmptyTagConditionProcessor(),
     ArrayJoinKeyValueOptimizer("tags"),
+    ConditionSimplifierProcessor(),
     PrewhereProcessor(
         prewhere_candidates,
         # Environment and release are excluded from prewhere in case of final
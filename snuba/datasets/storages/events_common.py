@@ -23,6 +23,7 @@ from snuba.query.expressions import Column, Literal
 from snuba.query.processors.arrayjoin_keyvalue_optimizer import (
     ArrayJoinKeyValueOptimizer,
 )
+from snuba.query.processors.condition_simplifier import ConditionSimplifierProcessor
 from snuba.query.processors.mapping_optimizer import MappingOptimizer
 from snuba.query.processors.mapping_promoter import MappingColumnPromoter
 from snuba.query.processors.prewhere import PrewhereProcessor
@@ -298,6 +299,7 @@ query_processors = [
     EventsPromotedBooleanContextsProcessor(),
     MappingOptimizer("tags", "_tags_hash_map", "events_tags_hash_map_enabled"),
     ArrayJoinKeyValueOptimizer("tags"),
+    ConditionSimplifierProcessor(),
     PrewhereProcessor(prewhere_candidates),
     FixedStringArrayColumnProcessor({"hierarchical_hashes"}, 32),
 ]
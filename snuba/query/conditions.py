@@ -1,4 +1,4 @@
-from typing import Any, Mapping, Optional, Sequence, Set
+from typing import Any, List, Mapping, Optional, Sequence, Set
 
 from snuba.query.dsl import literals_tuple
 from snuba.query.expressions import Expression, FunctionCall, Literal
@@ -240,14 +240,23 @@ def _get_first_level_conditions(
     In the AST, the condition is a tree, so we need some additional
     logic to extract the operands of the top level AND condition.
     """
-    match = TOP_LEVEL_CONDITIONS[function].match(condition)
-    if match is not None:
-        return [
-            *_get_first_level_conditions(match.expression("left"), function),
-            *_get_first_level_conditions(match.expression("right"), function),
-        ]
-    else:
-        return [condition]
+    # Conditions combined with combine_and_conditions/combine_or_conditions
+    # are nested one level per operand. Walking them with an explicit stack
+    # instead of recursing keeps long lists of conditions from hitting the
+    # recursion limit and from being copied once per level.
+    pattern = TOP_LEVEL_CONDITIONS[function]
+    conditions: List[Expression] = []
+    stack = [condition]
+    while stack:
+        current = stack.pop()
+        match = pattern.match(current)
+        if match is not None:
+            stack.append(match.expression("right"))
+            stack.append(match.expression("left"))
+        else:
+            conditions.append(current)
+
+    return conditions
 
 
 def combine_or_conditions(conditions: Sequence[Expression]) -> Expression:
@@ -268,12 +277,13 @@ def _combine_conditions(conditions: Sequence[Expression], function: str) -> Expr
     # TODO: Make BooleanFunctions an enum for stricter typing.
     assert function in (BooleanFunctions.AND, BooleanFunctions.OR)
     assert len(conditions) > 0
-    if len(conditions) == 1:
-        return conditions[0]
+    # Built from the last condition backwards, which produces the same
+    # right nested tree as recursing on conditions[1:] would.
+    combined = conditions[-1]
+    for condition in reversed(conditions[:-1]):
+        combined = binary_condition(function, condition, combined)
 
-    return binary_condition(
-        function, conditions[0], _combine_conditions(conditions[1:], function)
-    )
+    return combined
 
 
 CONDITION_MATCH = Or(
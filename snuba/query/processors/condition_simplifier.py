@@ -0,0 +1,86 @@
+import operator
+from datetime import date
+from typing import Any, Callable, List, Mapping, Set
+
+from snuba.clickhouse.processors import QueryProcessor
+from snuba.clickhouse.query import Query
+from snuba.query.conditions import (
+    ConditionFunctions,
+    combine_and_conditions,
+    get_first_level_and_conditions,
+)
+from snuba.query.expressions import Expression, FunctionCall, Literal
+from snuba.request.request_settings import RequestSettings
+
+LITERAL_OPERATORS: Mapping[str, Callable[[Any, Any], bool]] = {
+    ConditionFunctions.EQ: operator.eq,
+    ConditionFunctions.NEQ: operator.ne,
+    ConditionFunctions.LT: operator.lt,
+    ConditionFunctions.LTE: operator.le,
+    ConditionFunctions.GT: operator.gt,
+    ConditionFunctions.GTE: operator.ge,
+}
+
+
+def _is_tautology(condition: Expression) -> bool:
+    """
+    Returns True if the condition only compares two literals of the
+    same type and the comparison always holds, like `equals(1, 1)`.
+    """
+    if not isinstance(condition, FunctionCall) or len(condition.parameters) != 2:
+        return False
+
+    evaluate = LITERAL_OPERATORS.get(condition.function_name)
+    lhs, rhs = condition.parameters
+    if (
+        evaluate is None
+        or not isinstance(lhs, Literal)
+        or not isinstance(rhs, Literal)
+        or lhs.value is None
+        # Dates are formatted without timezone and microseconds, so comparing
+        # them in Python does not match what ClickHouse would evaluate.
+        or isinstance(lhs.value, date)
+        # Comparisons across types follow ClickHouse casting rules, which
+        # we do not want to replicate here. Checking both ways also rules
+        # out subclasses like bool and int.
+        or not isinstance(lhs.value, type(rhs.value))
+        or not isinstance(rhs.value, type(lhs.value))
+    ):
+        return False
+
+    return evaluate(lhs.value, rhs.value)
+
+
+class ConditionSimplifierProcessor(QueryProcessor):
+    """
+    Simplifies the top level conditions of the query before they are
+    moved into the prewhere clause and formatted:
+    - drops exact duplicates, which happen when the same condition is
+      provided by the client and added again during query processing
+      (like the time range).
+    - drops conditions that only compare literals and are always true.
+
+    Only conditions in the top level AND are considered since removing
+    them cannot change the result of the query.
+    """
+
+    def process_query(self, query: Query, request_settings: RequestSettings) -> None:
+        condition = query.get_condition()
+        if condition is None:
+            return
+
+        conditions = get_first_level_and_conditions(condition)
+        seen: Set[Expression] = set()
+        simplified: List[Expression] = []
+        for c in conditions:
+            if c in seen or _is_tautology(c):
+                continue
+            seen.add(c)
+            simplified.append(c)
+
+        if len(simplified) == len(conditions):
+            return
+
+        query.set_ast_condition(
+            combine_and_conditions(simplified) if simplified else None
+        )
@@ -7,6 +7,36 @@ import jsonschema
 Schema = Mapping[str, Any]  # placeholder for JSON schema
 
 
+_validate_properties = jsonschema.Draft6Validator.VALIDATORS["properties"]
+
+
+def _validate_and_default(
+    validator: object,
+    properties: Mapping[str, Any],
+    instance: MutableMapping[str, Any],
+    schema: Mapping[str, Any],
+) -> Generator[Exception, None, None]:
+    for property, subschema in properties.items():
+        if property not in instance and "default" in subschema:
+            if callable(subschema["default"]):
+                default_value = subschema["default"]()
+            else:
+                default_value = copy.deepcopy(subschema["default"])
+            instance[property] = default_value
+
+    for error in _validate_properties(validator, properties, instance, schema):
+        yield error
+
+
+# Building the validator class and the format checker is expensive and
+# neither depends on the value or the schema, so they are shared across
+# calls instead of being created for every request.
+_DefaultingValidator = jsonschema.validators.extend(
+    jsonschema.Draft4Validator, {"properties": _validate_and_default}
+)
+_FORMAT_CHECKER = jsonschema.FormatChecker()
+
+
 def validate_jsonschema(
     value: MutableMapping[str, Any],
     schema: MutableMapping[str, Any],
@@ -17,43 +47,16 @@ def validate_jsonschema(
     value if the value conforms to the schema, otherwise raising a
     ``jsonschema.ValidationError``.
     """
-    orig = jsonschema.Draft6Validator.VALIDATORS["properties"]
-
-    def validate_and_default(
-        validator: object,
-        properties: Mapping[str, Any],
-        instance: MutableMapping[str, Any],
-        schema: Mapping[str, Any],
-    ) -> Generator[Exception, None, None]:
-        for property, subschema in properties.items():
-            if property not in instance and "default" in subschema:
-                if callable(subschema["default"]):
-                    default_value = subschema["default"]()
-                else:
-                    default_value = copy.deepcopy(subschema["default"])
-                instance[property] = default_value
-
-        for error in orig(validator, properties, instance, schema):
-            yield error
-
     # Using schema defaults during validation will cause the input value to be
     # mutated, so to be on the safe side we create a deep copy of that value to
     # avoid unwanted side effects for the calling function.
     if set_defaults:
         value = copy.deepcopy(value)
 
-    validator_cls = (
-        jsonschema.validators.extend(
-            jsonschema.Draft4Validator, {"properties": validate_and_default}
-        )
-        if set_defaults
-        else jsonschema.Draft6Validator
-    )
+    validator_cls = _DefaultingValidator if set_defaults else jsonschema.Draft6Validator
 
     validator_cls(
-        schema,
-        types={"array": (list, tuple)},
-        format_checker=jsonschema.FormatChecker(),
+        schema, types={"array": (list, tuple)}, format_checker=_FORMAT_CHECKER,
     ).validate(value, schema)
 
     return value
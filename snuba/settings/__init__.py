@@ -17,6 +17,8 @@ DEFAULT_DATASET_NAME = "events"
 DISABLED_DATASETS: Set[str] = {"metrics"}
 
 # Clickhouse Options
+# Maximum number of native connections held by each connection pool. This
+# can be overridden per cluster through the "max_connections" key.
 CLICKHOUSE_MAX_POOL_SIZE = 25
 
 CLUSTERS: Sequence[Mapping[str, Any]] = [
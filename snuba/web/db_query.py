@@ -166,7 +166,12 @@ def update_query_metadata_and_stats(
     Also updates stats with any relevant information and returns the updated dict.
     """
     stats.update(query_settings)
-    sql_anonymized = format_query_anonymized(query).get_sql()
+    # The anonymized query is only consumed by the querylog. Producing it
+    # means formatting the whole query AST a second time, so skip it when
+    # queries are not recorded.
+    sql_anonymized = (
+        format_query_anonymized(query).get_sql() if settings.RECORD_QUERIES else ""
+    )
 
     query_metadata.query_list.append(
         ClickhouseQueryMetadata(
@@ -439,11 +444,19 @@ def raw_query(
         trace_id,
     )
 
-    execute_query_strategy = (
-        execute_query_with_readthrough_caching
-        if state.get_config("use_readthrough_query_cache", 1)
-        else execute_query_with_caching
-    )
+    # Consistent queries ask for data that has just been written. The result
+    # cache is keyed on the SQL only, so it could serve them a result produced
+    # by a non consistent query, or one that is up to cache_expiry_sec old.
+    # This is opt in since it also skips the readthrough deduplication for
+    # every consistent query, subscriptions included.
+    if request_settings.get_consistent() and state.get_config(
+        "consistent_bypass_cache", 0
+    ):
+        execute_query_strategy = execute_query_with_rate_limits
+    elif state.get_config("use_readthrough_query_cache", 1):
+        execute_query_strategy = execute_query_with_readthrough_caching
+    else:
+        execute_query_strategy = execute_query_with_caching
 
     try:
         result = execute_query_strategy(
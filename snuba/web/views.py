@@ -15,10 +15,12 @@ from typing import (
     Text,
     Tuple,
     Union,
+    cast,
 )
 from uuid import UUID
 
 import jsonschema
+import rapidjson
 import sentry_sdk
 import simplejson as json
 from arroyo import Message, Partition, Topic
@@ -72,6 +74,11 @@ logger = logging.getLogger("snuba.api")
 # Flask wants a Dict, not a Mapping
 RespTuple = Tuple[Text, int, Dict[Any, Any]]
 
+# Shared by every response instead of being rebuilt on each request. Flask
+# and werkzeug copy these into the response headers, they never mutate them.
+JSON_HEADERS = {"Content-Type": "application/json"}
+TEXT_HEADERS = {"Content-Type": "text/plain"}
+
 try:
     import uwsgi
 except ImportError:
@@ -166,20 +173,14 @@ def handle_invalid_json(exception: InvalidJsonRequestException) -> Response:
             raise TypeError()
 
     return Response(
-        json.dumps(data, indent=4, default=default_encode),
-        400,
-        {"Content-Type": "application/json"},
+        json.dumps(data, indent=4, default=default_encode), 400, JSON_HEADERS
     )
 
 
 @application.errorhandler(InvalidDatasetError)
 def handle_invalid_dataset(exception: InvalidDatasetError) -> Response:
     data = {"error": {"type": "dataset", "message": str(exception)}}
-    return Response(
-        json.dumps(data, sort_keys=True, indent=4),
-        404,
-        {"Content-Type": "application/json"},
-    )
+    return Response(json.dumps(data, sort_keys=True, indent=4), 404, JSON_HEADERS)
 
 
 @application.errorhandler(InvalidQueryException)
@@ -198,7 +199,7 @@ def handle_invalid_query(exception: InvalidQueryException) -> Response:
             {"error": {"type": "invalid_query", "message": str(exception)}}, indent=4
         ),
         400,
-        {"Content-Type": "application/json"},
+        JSON_HEADERS,
     )
 
 
@@ -213,7 +214,7 @@ def handle_internal_server_error(exception: InternalServerError) -> Response:
                 indent=4,
             ),
             500,
-            {"Content-Type": "application/json"},
+            JSON_HEADERS,
         )
 
     return Response(
@@ -222,7 +223,7 @@ def handle_internal_server_error(exception: InternalServerError) -> Response:
             indent=4,
         ),
         500,
-        {"Content-Type": "application/json"},
+        JSON_HEADERS,
     )
 
 
@@ -252,7 +253,7 @@ def dashboard(fmt: str = "html") -> Union[Response, RespTuple]:
             "concurrent": {k: state.get_concurrent(k) for k in ["global"]},
             "rates": {k: state.get_rates(k) for k in ["global"]},
         }
-        return (json.dumps(result), 200, {"Content-Type": "application/json"})
+        return (json.dumps(result), 200, JSON_HEADERS)
     else:
         return application.send_static_file("dashboard.html")
 
@@ -262,22 +263,14 @@ def dashboard(fmt: str = "html") -> Union[Response, RespTuple]:
 def config(fmt: str = "html") -> Union[Response, RespTuple]:
     if fmt == "json":
         if http_request.method == "GET":
-            return (
-                json.dumps(state.get_raw_configs()),
-                200,
-                {"Content-Type": "application/json"},
-            )
+            return (json.dumps(state.get_raw_configs()), 200, JSON_HEADERS)
         else:
             assert http_request.method == "POST"
             state.set_configs(
                 json.loads(http_request.data),
                 user=http_request.headers.get("x-forwarded-email"),
             )
-            return (
-                json.dumps(state.get_raw_configs()),
-                200,
-                {"Content-Type": "application/json"},
-            )
+            return (json.dumps(state.get_raw_configs()), 200, JSON_HEADERS)
 
     else:
         return application.send_static_file("config.html")
@@ -285,11 +278,7 @@ def config(fmt: str = "html") -> Union[Response, RespTuple]:
 
 @application.route("/config/changes.json")
 def config_changes() -> RespTuple:
-    return (
-        json.dumps(state.get_config_changes()),
-        200,
-        {"Content-Type": "application/json"},
-    )
+    return (json.dumps(state.get_config_changes()), 200, JSON_HEADERS)
 
 
 @application.route("/health")
@@ -310,7 +299,7 @@ def health() -> Response:
             body["clickhouse_ok"] = clickhouse_health
         status = 502
 
-    return Response(json.dumps(body), status, {"Content-Type": "application/json"})
+    return Response(json.dumps(body), status, JSON_HEADERS)
 
 
 def parse_request_body(http_request: Request) -> MutableMapping[str, Any]:
@@ -324,6 +313,19 @@ def parse_request_body(http_request: Request) -> MutableMapping[str, Any]:
             raise JsonDecodeException(str(error)) from error
 
 
+def dump_payload(payload: Mapping[str, Any]) -> str:
+    """
+    Serializes the payload of a successful query. Result sets can be large,
+    so this uses rapidjson, which is considerably faster than simplejson.
+    NaN/Infinity and Decimal values, that ClickHouse can return, are
+    serialized the same way simplejson does.
+    """
+    return cast(
+        str,
+        rapidjson.dumps(payload, number_mode=rapidjson.NM_NAN | rapidjson.NM_DECIMAL),
+    )
+
+
 def _trace_transaction(dataset: Dataset) -> None:
     with sentry_sdk.configure_scope() as scope:
         if scope.span:
@@ -451,7 +453,7 @@ def dataset_query(
                 {"error": details, "timing": timer.for_json(), **exception.extra}
             ),
             status,
-            {"Content-Type": "application/json"},
+            JSON_HEADERS,
         )
 
     payload: MutableMapping[str, Any] = {**result.result, "timing": timer.for_json()}
@@ -459,15 +461,13 @@ def dataset_query(
     if settings.STATS_IN_RESPONSE or request.settings.get_debug():
         payload.update(result.extra)
 
-    return Response(json.dumps(payload), 200, {"Content-Type": "application/json"})
+    return Response(dump_payload(payload), 200, JSON_HEADERS)
 
 
 @application.errorhandler(InvalidSubscriptionError)
 def handle_subscription_error(exception: InvalidSubscriptionError) -> Response:
     data = {"error": {"type": "subscription", "message": str(exception)}}
-    return Response(
-        json.dumps(data, indent=4), 400, {"Content-Type": "application/json"},
-    )
+    return Response(json.dumps(data, indent=4), 400, JSON_HEADERS)
 
 
 @application.route("/<dataset:dataset>/subscriptions", methods=["POST"])
@@ -475,11 +475,7 @@ def handle_subscription_error(exception: InvalidSubscriptionError) -> Response:
 def create_subscription(*, dataset: Dataset, timer: Timer) -> RespTuple:
     subscription = SubscriptionDataCodec().decode(http_request.data)
     identifier = SubscriptionCreator(dataset).create(subscription, timer)
-    return (
-        json.dumps({"subscription_id": str(identifier)}),
-        202,
-        {"Content-Type": "application/json"},
-    )
+    return (json.dumps({"subscription_id": str(identifier)}), 202, JSON_HEADERS)
 
 
 @application.route(
@@ -487,7 +483,7 @@ def create_subscription(*, dataset: Dataset, timer: Timer) -> RespTuple:
 )
 def delete_subscription(*, dataset: Dataset, partition: int, key: str) -> RespTuple:
     SubscriptionDeleter(dataset, PartitionId(partition)).delete(UUID(key))
-    return "ok", 202, {"Content-Type": "text/plain"}
+    return "ok", 202, TEXT_HEADERS
 
 
 if application.debug or application.testing:
@@ -498,30 +494,28 @@ if application.debug or application.testing:
     def write(*, dataset: Dataset) -> RespTuple:
         from snuba.processor import InsertBatch
 
+        table_writer = enforce_table_writer(dataset)
+        processor = table_writer.get_stream_loader().get_processor()
+
         rows: MutableSequence[WriterTableRow] = []
         offset_base = int(round(time.time() * 1000))
-        for index, message in enumerate(json.loads(http_request.data)):
+        for index, message in enumerate(rapidjson.loads(http_request.data)):
             offset = offset_base + index
-            processed_message = (
-                enforce_table_writer(dataset)
-                .get_stream_loader()
-                .get_processor()
-                .process_message(
-                    message,
-                    KafkaMessageMetadata(
-                        offset=offset, partition=0, timestamp=datetime.utcnow()
-                    ),
-                )
+            processed_message = processor.process_message(
+                message,
+                KafkaMessageMetadata(
+                    offset=offset, partition=0, timestamp=datetime.utcnow()
+                ),
             )
             if processed_message:
                 assert isinstance(processed_message, InsertBatch)
                 rows.extend(processed_message.rows)
 
         BatchWriterEncoderWrapper(
-            enforce_table_writer(dataset).get_batch_writer(metrics), JSONRowEncoder(),
+            table_writer.get_batch_writer(metrics), JSONRowEncoder(),
         ).write(rows)
 
-        return ("ok", 200, {"Content-Type": "text/plain"})
+        return ("ok", 200, TEXT_HEADERS)
 
     @application.route("/tests/<dataset:dataset>/eventstream", methods=["POST"])
     def eventstream(*, dataset: Dataset) -> RespTuple:
@@ -574,17 +568,17 @@ if application.debug or application.testing:
                 batch = [processed]
                 worker.flush_batch(batch)
 
-        return ("ok", 200, {"Content-Type": "text/plain"})
+        return ("ok", 200, TEXT_HEADERS)
 
     @application.route("/tests/<dataset:dataset>/drop", methods=["POST"])
     def drop(*, dataset: Dataset) -> RespTuple:
         truncate_dataset(dataset)
         redis_client.flushdb()
 
-        return ("ok", 200, {"Content-Type": "text/plain"})
+        return ("ok", 200, TEXT_HEADERS)
 
     @application.route("/tests/error")
     def error() -> RespTuple:
         1 / 0
         # unreachable. A valid response is added for mypy
-        return ("error", 500, {"Content-Type": "text/plain"})
+        return ("error", 500, TEXT_HEADERS)
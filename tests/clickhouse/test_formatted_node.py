@@ -82,3 +82,17 @@ def test_composite_query() -> None:
         ],
         "WHERE something something",
     ]
+
+
+def test_cached_sql() -> None:
+    query = FormattedQuery(
+        [StringNode("SELECT a"), PaddingNode("FROM", StringNode("somewhere"))]
+    )
+
+    assert query.get_sql() == "SELECT a FROM somewhere"
+    assert query.get_sql("JSON") == "SELECT a FROM somewhere FORMAT JSON"
+    # The format is only applied to the returned string, not the cached one.
+    assert query.__dict__["_FormattedQuery__sql"] == "SELECT a FROM somewhere"
+    assert query.get_sql() == "SELECT a FROM somewhere"
+    assert query.get_sql("JSON") == "SELECT a FROM somewhere FORMAT JSON"
+    assert query.get_sql("TSV") == "SELECT a FROM somewhere FORMAT TSV"
@@ -1,3 +1,5 @@
+from datetime import date, datetime, timedelta, timezone
+
 import pytest
 
 from snuba.clickhouse.formatter.expression import (
@@ -33,6 +35,28 @@ test_expressions = [
     ),  # NULL with alias
     (Literal(None, True), "true", "$B"),  # True
     (Literal(None, False), "false", "$B"),  # False
+    (
+        Literal(None, datetime(2020, 1, 2, 3, 4, 5, 678)),
+        "toDateTime('2020-01-02T03:04:05', 'Universal')",
+        "$DT",
+    ),  # Datetime literal, microseconds are dropped
+    (
+        Literal(
+            "ts", datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2)))
+        ),
+        "(toDateTime('2020-01-02T03:04:05', 'Universal') AS ts)",
+        "$DT",
+    ),  # Datetime literal with timezone and alias
+    (
+        Literal(None, datetime(5, 1, 2, 3, 4, 5)),
+        "toDateTime('0005-01-02T03:04:05', 'Universal')",
+        "$DT",
+    ),  # Datetime literal with a zero padded year
+    (
+        Literal(None, date(2020, 1, 2)),
+        "toDate('2020-01-02', 'Universal')",
+        "$D",
+    ),  # Date literal
     (
         Column(None, "table1", "column1"),
         "table1.column1",
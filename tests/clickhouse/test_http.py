@@ -0,0 +1,24 @@
+from datetime import datetime
+
+import pytest
+
+from snuba.clickhouse.http import JSONRowEncoder
+
+
+def test_json_row_encoder() -> None:
+    encoder = JSONRowEncoder()
+    row = {
+        "event_id": "a" * 32,
+        "project_id": 1,
+        "timestamp": datetime(2020, 1, 2, 3, 4, 5, 678),
+        "tags.key": ["a", "b"],
+        "message": None,
+    }
+
+    assert encoder.encode(row) == (
+        b'{"event_id":"aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa","project_id":1,'
+        b'"timestamp":"2020-01-02 03:04:05","tags.key":["a","b"],"message":null}'
+    )
+
+    with pytest.raises(TypeError):
+        encoder.encode({"value": object()})
@@ -153,3 +153,33 @@ def test_cache_connections() -> None:
         cluster.ClickhouseClientSettings.OPTIMIZE,
         cluster.ClickhouseNode("localhost", 8002),
     )
+
+
+def test_connection_pool_size() -> None:
+    default_cluster = cluster.ClickhouseCluster(
+        "localhost", 8000, "default", "", "default", 8001, {"events"}, True
+    )
+    assert (
+        default_cluster.get_query_connection(
+            cluster.ClickhouseClientSettings.QUERY
+        ).pool.maxsize
+        == settings.CLICKHOUSE_MAX_POOL_SIZE
+    )
+
+    sized_cluster = cluster.ClickhouseCluster(
+        "localhost",
+        8000,
+        "default",
+        "",
+        "default",
+        8001,
+        {"events"},
+        True,
+        max_connections=50,
+    )
+    assert (
+        sized_cluster.get_query_connection(
+            cluster.ClickhouseClientSettings.QUERY
+        ).pool.maxsize
+        == 50
+    )
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+
+from snuba.clickhouse.query import Query
+from snuba.query.conditions import (
+    BooleanFunctions,
+    ConditionFunctions,
+    binary_condition,
+)
+from snuba.query.expressions import Column, Expression, Literal
+from snuba.query.processors.condition_simplifier import ConditionSimplifierProcessor
+from snuba.request.request_settings import HTTPRequestSettings
+from tests.query.processors.query_builders import build_query
+
+project_condition = binary_condition(
+    ConditionFunctions.EQ, Column(None, None, "project_id"), Literal(None, 1)
+)
+event_condition = binary_condition(
+    ConditionFunctions.EQ, Column(None, None, "event_id"), Literal(None, "a" * 32)
+)
+tautology = binary_condition(ConditionFunctions.EQ, Literal(None, 1), Literal(None, 1))
+naive_aware_comparison = binary_condition(
+    ConditionFunctions.LT,
+    Literal(None, datetime(2020, 1, 1)),
+    Literal(None, datetime(2020, 1, 2, tzinfo=timezone.utc)),
+)
+# Both sides are formatted as toDateTime('2020-01-01T00:00:00', 'Universal')
+microsecond_comparison = binary_condition(
+    ConditionFunctions.GT,
+    Literal(None, datetime(2020, 1, 1, 0, 0, 0, 5)),
+    Literal(None, datetime(2020, 1, 1)),
+)
+# The formatter drops the offset, so ClickHouse compares 10:00 with 09:00
+mixed_offset_comparison = binary_condition(
+    ConditionFunctions.LT,
+    Literal(None, datetime(2020, 1, 1, 10, tzinfo=timezone(timedelta(hours=2)))),
+    Literal(None, datetime(2020, 1, 1, 9, tzinfo=timezone.utc)),
+)
+
+test_data = [
+    pytest.param(None, None, id="no condition"),
+    pytest.param(
+        binary_condition(BooleanFunctions.AND, project_condition, event_condition),
+        binary_condition(BooleanFunctions.AND, project_condition, event_condition),
+        id="nothing to simplify",
+    ),
+    pytest.param(
+        binary_condition(
+            BooleanFunctions.AND,
+            project_condition,
+            binary_condition(BooleanFunctions.AND, event_condition, project_condition),
+        ),
+        binary_condition(BooleanFunctions.AND, project_condition, event_condition),
+        id="duplicate condition",
+    ),
+    pytest.param(
+        binary_condition(BooleanFunctions.AND, tautology, project_condition),
+        project_condition,
+        id="literal tautology",
+    ),
+    pytest.param(tautology, None, id="only a tautology"),
+    pytest.param(
+        binary_condition(
+            BooleanFunctions.AND,
+            binary_condition(ConditionFunctions.EQ, Literal(None, 1), Literal(None, 2)),
+            project_condition,
+        ),
+        binary_condition(
+            BooleanFunctions.AND,
+            binary_condition(ConditionFunctions.EQ, Literal(None, 1), Literal(None, 2)),
+            project_condition,
+        ),
+        id="false literal comparisons are left to Clickhouse",
+    ),
+    pytest.param(
+        binary_condition(
+            BooleanFunctions.OR,
+            binary_condition(ConditionFunctions.EQ, Literal(None, 1), Literal(None, 1)),
+            project_condition,
+        ),
+        binary_condition(
+            BooleanFunctions.OR,
+            binary_condition(ConditionFunctions.EQ, Literal(None, 1), Literal(None, 1)),
+            project_condition,
+        ),
+        id="nested conditions are not simplified",
+    ),
+    pytest.param(
+        binary_condition(
+            BooleanFunctions.AND, naive_aware_comparison, project_condition,
+        ),
+        binary_condition(
+            BooleanFunctions.AND, naive_aware_comparison, project_condition,
+        ),
+        id="literals that cannot be compared are left to Clickhouse",
+    ),
+    pytest.param(
+        binary_condition(
+            BooleanFunctions.AND, microsecond_comparison, project_condition,
+        ),
+        binary_condition(
+            BooleanFunctions.AND, microsecond_comparison, project_condition,
+        ),
+        id="datetimes differing in microseconds are left to Clickhouse",
+    ),
+    pytest.param(
+        binary_condition(
+            BooleanFunctions.AND, mixed_offset_comparison, project_condition,
+        ),
+        binary_condition(
+            BooleanFunctions.AND, mixed_offset_comparison, project_condition,
+        ),
+        id="datetimes with different offsets are left to Clickhouse",
+    ),
+]
+
+
+@pytest.mark.parametrize("condition, expected", test_data)  # type: ignore
+def test_condition_simplifier(
+    condition: Optional[Expression], expected: Optional[Expression]
+) -> None:
+    query: Query = build_query([], condition)
+    ConditionSimplifierProcessor().process_query(query, HTTPRequestSettings())
+    assert query.get_condition() == expected
@@ -2,6 +2,7 @@ from snuba.query.conditions import (
     BooleanFunctions,
     ConditionFunctions,
     binary_condition,
+    combine_and_conditions,
     condition_pattern,
     get_first_level_and_conditions,
     get_first_level_or_conditions,
@@ -251,6 +252,22 @@ def test_first_level_conditions() -> None:
     ]
 
 
+def test_long_condition_list() -> None:
+    # Enough conditions to exceed the default recursion limit if the
+    # condition tree was built or flattened recursively.
+    conditions = [
+        binary_condition(
+            ConditionFunctions.EQ, Column(None, None, "column"), Literal(None, i)
+        )
+        for i in range(5000)
+    ]
+    combined = combine_and_conditions(conditions)
+    assert isinstance(combined, FunctionCall)
+    assert combined.function_name == BooleanFunctions.AND
+    assert combined.parameters[0] == conditions[0]
+    assert get_first_level_and_conditions(combined) == conditions
+
+
 def test_binary_match() -> None:
     c1 = binary_condition(
         ConditionFunctions.EQ, Column(None, "table1", "column1"), Literal(None, "test"),
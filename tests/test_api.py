@@ -1882,6 +1882,39 @@ class TestApi(SimpleAPITest):
         )
         assert response["stats"]["consistent"] == False
 
+    def test_consistent_bypasses_cache(self) -> None:
+        state.set_config("consistent_bypass_cache", 1)
+
+        def run_query(consistent: bool) -> Any:
+            query = json.dumps(
+                {
+                    "project": 2,
+                    "aggregations": [["count()", "", "aggregate"]],
+                    "consistent": consistent,
+                    "debug": True,
+                    "from_date": self.base_time.isoformat(),
+                    "to_date": (
+                        self.base_time + timedelta(minutes=self.minutes)
+                    ).isoformat(),
+                }
+            )
+            return json.loads(
+                self.app.post(
+                    "/query", data=query, headers={"referer": "test_query"}
+                ).data
+            )
+
+        # Consistent queries neither read nor populate the cache.
+        for _ in range(2):
+            response = run_query(consistent=True)
+            assert response["stats"]["consistent"]
+            assert not response["stats"].get("cache_hit")
+
+        assert not run_query(consistent=False)["stats"].get("cache_hit")
+        assert run_query(consistent=False)["stats"]["cache_hit"]
+
+        state.delete_config("consistent_bypass_cache")
+
     def test_gracefully_handle_multiple_conditions_on_same_column(self) -> None:
         response = self.post(
             json.dumps(
@@ -1,10 +1,12 @@
 import logging
+from decimal import Decimal
 
 import pytest
+import simplejson as json
 
 from snuba.query.exceptions import InvalidQueryException
 from snuba.query.parser import ParsingException
-from snuba.web.views import handle_invalid_query
+from snuba.web.views import dump_payload, handle_invalid_query
 
 invalid_query_exception_test_cases = [
     pytest.param(
@@ -31,3 +33,18 @@ def test_handle_invalid_query(
         _ = handle_invalid_query(exception=exception)
         for record in caplog.records:
             assert record.levelname == expected_log_level
+
+
+def test_dump_payload() -> None:
+    payload = {
+        "data": [
+            {"title": "\u00e9v\u00e9nement", "count": 10, "avg": 1.5},
+            {"title": "x", "count": 1, "avg": Decimal("2.25")},
+        ],
+        "meta": [{"name": "title", "type": "String"}],
+        "timing": {"timestamp": 1, "duration_ms": 2, "marks_ms": {}},
+    }
+    assert json.loads(dump_payload(payload), use_decimal=True) == json.loads(
+        json.dumps(payload), use_decimal=True
+    )
+    assert dump_payload({"avg": float("nan")}) == '{"avg":NaN}'